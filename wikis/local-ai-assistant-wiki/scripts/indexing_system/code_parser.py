@@ -1,7 +1,190 @@
+import json
+import logging
+import mmap
 import os
-from typing import List, Dict, Optional
+import re
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterator, List, Dict, FrozenSet, Optional, Tuple
 from pathlib import Path
 import fnmatch
+import functools
+
+_log = logging.getLogger(__name__)
+
+# Number of file reads kept in flight while parsing a repository
+_READ_QUEUE_DEPTH = 128
+
+# Files larger than this are decoded straight from a memory map
+_MMAP_THRESHOLD = 64 * 1024
+
+# Bumped whenever the on-disk parse cache layout changes
+_CACHE_VERSION = 1
+
+# Maps lowercase file extensions (without the dot) to language names
+_LANGUAGE_MAP = {
+    'py': 'python',
+    'js': 'javascript',
+    'ts': 'typescript',
+    'jsx': 'javascript',
+    'tsx': 'typescript',
+    'java': 'java',
+    'c': 'c',
+    'cpp': 'cpp',
+    'h': 'c',
+    'hpp': 'cpp',
+    'cs': 'csharp',
+    'go': 'go',
+    'rb': 'ruby',
+    'php': 'php',
+    'swift': 'swift',
+    'kt': 'kotlin',
+    'rs': 'rust',
+    'lua': 'lua',
+    'sh': 'bash',
+    'html': 'html',
+    'css': 'css',
+    'scss': 'scss',
+    'sql': 'sql',
+    'md': 'markdown',
+    'json': 'json',
+    'xml': 'xml',
+    'yaml': 'yaml',
+    'yml': 'yaml',
+    'toml': 'toml',
+}
+_KNOWN_EXTS = frozenset(_LANGUAGE_MAP)
+
+# Ignore patterns of the form '*.ext' are checked with a set lookup instead of the regex
+_BARE_EXT_PATTERN = re.compile(r'\*\.[A-Za-z0-9]+')
+
+@functools.lru_cache(maxsize=16)
+def _compile_ignore(patterns: Tuple[str, ...]) -> Tuple[FrozenSet[str], re.Pattern]:
+    """
+    Compile ignore globs once, shared by parsers with the same patterns.
+    
+    Bare extension patterns such as '*.png' become a set of lowercase
+    extensions; all remaining globs are unioned into a single regex.
+    
+    Args:
+        patterns: Tuple of glob patterns
+    
+    Returns:
+        Tuple of (ignored extensions, compiled regex matching any other pattern)
+    """
+    exts = frozenset(p[2:].lower() for p in patterns if _BARE_EXT_PATTERN.fullmatch(p))
+    globs = [p for p in patterns if not _BARE_EXT_PATTERN.fullmatch(p)]
+    # An empty alternation would match everything, so use a never-matching regex
+    regex = "|".join(f"(?:{fnmatch.translate(p)})" for p in globs) or r"(?!)"
+    return exts, re.compile(regex)
+
+class _ParseCache:
+    """
+    SQLite-backed store of parse results keyed by relative path.
+    
+    Only the (mtime_ns, size) index is held in memory; parsed contents are
+    read and written one file at a time. Worker threads share a single
+    connection behind a lock. Write errors (e.g. a read-only cache file)
+    are logged once and further writes are skipped.
+    """
+    
+    def __init__(self, path: str, settings: Dict):
+        """
+        Open the cache, discarding its contents if it was written with other settings.
+        
+        Args:
+            path: Database file to open or create
+            settings: Settings that affect parse results
+        
+        Raises:
+            sqlite3.Error: If the database cannot be opened or initialized
+        """
+        self._lock = threading.Lock()
+        self._writable = True
+        self._seen = set()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        try:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (settings TEXT)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files "
+                "(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, data TEXT)"
+            )
+            settings_json = json.dumps(settings, sort_keys=True)
+            row = self._conn.execute("SELECT settings FROM meta").fetchone()
+            if row is None or row[0] != settings_json:
+                self._conn.execute("DELETE FROM files")
+                self._conn.execute("DELETE FROM meta")
+                self._conn.execute("INSERT INTO meta VALUES (?)", (settings_json,))
+                self._conn.commit()
+            self._index = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self._conn.execute("SELECT path, mtime_ns, size FROM files")
+            }
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+    
+    def get(self, file_path: str, key: Tuple[int, int]) -> Optional[Dict]:
+        """
+        Return the cached result for a file if its (mtime_ns, size) key matches.
+        
+        Args:
+            file_path: Relative path to the file within the repository
+            key: Current (mtime_ns, size) of the file
+        
+        Returns:
+            Cached parsed file dictionary, or None on a miss
+        """
+        self._seen.add(file_path)
+        if self._index.get(file_path) != key:
+            return None
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM files WHERE path = ?", (file_path,)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def put(self, file_path: str, key: Tuple[int, int], parsed_file: Optional[Dict]) -> None:
+        """
+        Store a freshly parsed file, or drop its stale entry if it was skipped.
+        
+        Args:
+            file_path: Relative path to the file within the repository
+            key: (mtime_ns, size) the file was parsed at
+            parsed_file: Result of parse_file, or None
+        """
+        if not self._writable:
+            return
+        with self._lock:
+            try:
+                if parsed_file:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                        (file_path, key[0], key[1], json.dumps(parsed_file)),
+                    )
+                elif file_path in self._index:
+                    self._conn.execute("DELETE FROM files WHERE path = ?", (file_path,))
+            except sqlite3.Error as e:
+                self._writable = False
+                _log.warning("Not updating parse cache: %s", e)
+    
+    def close(self, complete: bool) -> None:
+        """
+        Commit pending writes and close the database.
+        
+        Args:
+            complete: Whether the whole repository was walked; only then are
+                      entries for files that no longer exist removed
+        """
+        try:
+            if complete and self._writable:
+                gone = [(path,) for path in self._index if path not in self._seen]
+                self._conn.executemany("DELETE FROM files WHERE path = ?", gone)
+            self._conn.commit()
+        except sqlite3.Error as e:
+            _log.warning("Could not save parse cache: %s", e)
+        finally:
+            self._conn.close()
 
 class CodeParser:
     """
@@ -18,22 +201,41 @@ class CodeParser:
     to exclude irrelevant files (like binaries, cache files, etc.).
     """
     
-    def __init__(self, repo_path: str, ignore_patterns: Optional[List[str]] = None):
+    def __init__(self, repo_path: str, ignore_patterns: Optional[List[str]] = None,
+                 include_unknown: bool = False, max_bytes: Optional[int] = 1024 * 1024,
+                 max_workers: Optional[int] = None, cache_path: Optional[str] = None):
         """
         Initialize the code parser with repository path and ignore patterns.
         
         Args:
             repo_path: Path to the repository to be parsed
             ignore_patterns: List of glob patterns for files/directories to ignore
-                             (defaults to common non-code files if None)
+                             (defaults to common non-code files if None).
+                             The patterns are compiled once here, so treat
+                             the list as immutable after initialization.
+            include_unknown: Whether to parse files whose language cannot be
+                             determined from their extension
+            max_bytes: Files larger than this many bytes are skipped
+                       (None disables the limit)
+            max_workers: Number of threads used to read files in parallel
+                         (defaults to min(32, 4 * CPU count))
+            cache_path: SQLite file used to reuse results for files whose
+                        mtime and size are unchanged since the last run
+                        (None disables caching)
         """
         self.repo_path = Path(repo_path)
+        self.include_unknown = include_unknown
+        self.max_bytes = max_bytes
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.cache_path = cache_path
         self.ignore_patterns = ignore_patterns or [
             "*.git/*", "*.pyc", "__pycache__/*", "*.ipynb_checkpoints/*",
             "*.venv/*", "*venv/*", "*node_modules/*", "*.DS_Store",
             "*.idea/*", "*.vscode/*", "*.png", "*.jpg", "*.jpeg", "*.gif",
             "*.svg", "*.ico", "*.pdf", "*.zip", "*.tar.gz", "*.jar"
         ]
+        # Split bare '*.ext' patterns into a set and union the rest into one regex
+        self._ignored_exts, self._ignore_re = _compile_ignore(tuple(self.ignore_patterns))
     
     def should_ignore(self, file_path: str) -> bool:
         """
@@ -41,6 +243,9 @@ class CodeParser:
         
         This function helps filter out non-code files, build artifacts,
         and other irrelevant files that shouldn't be included in the index.
+        Bare extension patterns like '*.png' are checked first with a set
+        lookup and match case-insensitively; other globs go through the
+        compiled regex.
         
         Args:
             file_path: Relative path of the file to check
@@ -48,10 +253,10 @@ class CodeParser:
         Returns:
             True if the file should be ignored, False otherwise
         """
-        for pattern in self.ignore_patterns:
-            if fnmatch.fnmatch(file_path, pattern):
-                return True
-        return False
+        _, dot, ext = file_path.rpartition('.')
+        if dot and ext.lower() in self._ignored_exts:
+            return True
+        return self._ignore_re.match(file_path) is not None
     
     def get_file_language(self, file_path: str) -> Optional[str]:
         """
@@ -66,71 +271,70 @@ class CodeParser:
         Returns:
             String representing the programming language, or None if unknown
         """
-        ext = os.path.splitext(file_path)[1].lower()
-        language_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.jsx': 'javascript',
-            '.tsx': 'typescript',
-            '.java': 'java',
-            '.c': 'c',
-            '.cpp': 'cpp',
-            '.h': 'c',
-            '.hpp': 'cpp',
-            '.cs': 'csharp',
-            '.go': 'go',
-            '.rb': 'ruby',
-            '.php': 'php',
-            '.swift': 'swift',
-            '.kt': 'kotlin',
-            '.rs': 'rust',
-            '.lua': 'lua',
-            '.sh': 'bash',
-            '.html': 'html',
-            '.css': 'css',
-            '.scss': 'scss',
-            '.sql': 'sql',
-            '.md': 'markdown',
-            '.json': 'json',
-            '.xml': 'xml',
-            '.yaml': 'yaml',
-            '.yml': 'yaml',
-            '.toml': 'toml',
-        }
-        return language_map.get(ext)
+        # rpartition is cheaper than os.path.splitext for this per-file check
+        stem, dot, ext = file_path.rpartition('.')
+        # Like splitext, a dotfile such as '.json' has no extension
+        if not dot or stem[-1:] in ('', '/', os.sep):
+            return None
+        ext = ext.lower()
+        # Most unknown extensions (binaries, lockfiles) stop at the set check
+        return _LANGUAGE_MAP[ext] if ext in _KNOWN_EXTS else None
     
     def parse_file(self, file_path: str) -> Dict:
         """
         Parse a single file and return its content with metadata.
         
         This function reads the file content and collects important metadata
-        such as the file path, language, and size, which will be used in
-        subsequent processing steps.
+        such as the file path, language, and size in bytes, which will be used in
+        subsequent processing steps. Files with an unknown language (unless
+        include_unknown is set) and files larger than max_bytes are skipped
+        without being read.
         
         Args:
             file_path: Relative path to the file within the repository
             
         Returns:
-            Dictionary containing file content and metadata, or None if parsing fails
+            Dictionary containing file content and metadata, or None if the
+            file is skipped or parsing fails
         """
+        language = self.get_file_language(file_path)
+        if language is None and not self.include_unknown:
+            return None
+        
         abs_path = os.path.join(self.repo_path, file_path)
         try:
-            with open(abs_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Binary mode skips text-layer newline handling; decode once at the end
+            with open(abs_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if self.max_bytes is not None and size > self.max_bytes:
+                    return None
+                content = None
+                if size > _MMAP_THRESHOLD:
+                    # Decode from the page cache directly instead of copying
+                    # the file into an intermediate bytes object first.
+                    # On Windows the mapping keeps the file locked until closed.
+                    try:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            content = str(mm, 'utf-8', 'replace')
+                    except (ValueError, OSError):
+                        # The file was truncated to zero bytes after fstat, or
+                        # its filesystem (FUSE, some network mounts) does not
+                        # support mapping; fall back to a plain read
+                        pass
+                if content is None:
+                    content = f.read().decode('utf-8', errors='replace')
             
-            language = self.get_file_language(file_path)
             return {
                 'path': file_path,
                 'content': content,
                 'language': language,
-                'size': len(content)
+                'size': size
             }
-        except Exception as e:
-            print(f"Error parsing file {file_path}: {e}")
+        except OSError as e:
+            _log.warning("Skipping %s: %s", file_path, e)
             return None
     
-    def parse_repository(self) -> List[Dict]:
+    def parse_repository(self, ordered: bool = True) -> Iterator[Dict]:
         """
         Parse all files in the repository.
         
@@ -138,64 +342,179 @@ class CodeParser:
         1. Finding all relevant files in the repository
         2. Parsing each file to extract content and metadata
         
+        Files are read on a thread pool so that the blocking reads overlap,
+        with at most _READ_QUEUE_DEPTH reads in flight. Only that bounded
+        window of files is held in memory. Wrap the call in list(...) if all
+        results are needed at once.
+        
+        When cache_path is set, files whose mtime and size match the cache
+        are not reopened; their results are read back from an SQLite file
+        one at a time, so caching does not raise peak memory beyond a small
+        per-file (mtime, size) index. Cache errors are logged and never
+        interrupt parsing.
+        
+        Args:
+            ordered: Yield results in walk order; when False, results are
+                     yielded as soon as each read completes
+        
         Returns:
-            List of dictionaries, each containing a file's content and metadata
+            Iterator of dictionaries, each containing a file's content and metadata
         """
-        file_paths = self._get_relevant_file_paths()
-        parsed_files = []
-        for file_path in file_paths:
-            parsed_file = self.parse_file(file_path)
-            if parsed_file:
-                parsed_files.append(parsed_file)
-        return parsed_files
+        cache = self._open_cache() if self.cache_path is not None else None
+        parse = self.parse_file if cache is None else functools.partial(self._parse_cached, cache=cache)
+        
+        complete = False
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                pending = deque()
+                for file_path in self._get_relevant_file_paths():
+                    pending.append(executor.submit(parse, file_path))
+                    if len(pending) >= _READ_QUEUE_DEPTH:
+                        yield from self._drain(pending, ordered, _READ_QUEUE_DEPTH - 1)
+                
+                yield from self._drain(pending, ordered, 0)
+            complete = True
+        finally:
+            if cache is not None:
+                cache.close(complete)
 
-    def _get_relevant_file_paths(self) -> List[str]:
+    def _parse_cached(self, file_path: str, cache: _ParseCache) -> Optional[Dict]:
         """
-        Get all relevant file paths in the repository.
+        Parse a file, reusing the cached result if its mtime and size are unchanged.
         
-        This helper method walks through the repository directory structure
-        and returns paths to all files that should be included in the index.
+        Args:
+            file_path: Relative path to the file within the repository
+            cache: Open parse cache for this run
         
         Returns:
-            List of relative file paths
+            Dictionary containing file content and metadata, or None if the
+            file is skipped or parsing fails
         """
-        all_files = self._get_all_files()
-        relevant_paths = [path for path in all_files if not self.should_ignore(path)]
-        return relevant_paths
+        try:
+            st = os.stat(os.path.join(self.repo_path, file_path))
+        except OSError:
+            return self.parse_file(file_path)
+        
+        key = (st.st_mtime_ns, st.st_size)
+        parsed_file = cache.get(file_path, key)
+        if parsed_file is None:
+            parsed_file = self.parse_file(file_path)
+            cache.put(file_path, key, parsed_file)
+        return parsed_file
 
-    def _get_all_files(self) -> List[str]:
+    def _open_cache(self) -> Optional[_ParseCache]:
         """
-        Get all file paths in the repository.
+        Open the parse cache at cache_path.
         
         Returns:
-            List of normalized relative file paths
+            Open cache, or None if it cannot be opened (parsing then runs uncached)
+        """
+        settings = {
+            'version': _CACHE_VERSION,
+            'include_unknown': self.include_unknown,
+            'max_bytes': self.max_bytes,
+        }
+        try:
+            return _ParseCache(self.cache_path, settings)
+        except sqlite3.Error as e:
+            _log.warning("Parse cache %s unavailable: %s", self.cache_path, e)
+            return None
+
+    def _drain(self, pending: deque, ordered: bool, keep: int) -> Iterator[Dict]:
         """
-        all_files = []
+        Yield parsed files from pending futures until at most `keep` remain.
         
-        for root, _, files in os.walk(self.repo_path):
-            rel_root = os.path.relpath(root, self.repo_path)
-            
-            # Create relative paths for all files in this directory
-            relative_paths = [os.path.join(rel_root, file) for file in files]
-            
-            # Normalize all paths
-            normalized_paths = [self._normalize_path(path) for path in relative_paths]
+        Args:
+            pending: Queue of parse_file futures in submission order
+            ordered: Take futures from the front of the queue instead of
+                     whichever finish first
+            keep: Number of futures to leave in the queue
+        
+        Returns:
+            Iterator of successfully parsed file dictionaries
+        """
+        while len(pending) > keep:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
             
-            # Add to the list of all files
-            all_files.extend(normalized_paths)
+            for future in done:
+                parsed_file = future.result()
+                if parsed_file:
+                    yield parsed_file
+
+    def _get_relevant_file_paths(self) -> Iterator[str]:
+        """
+        Get all relevant file paths in the repository.
+        
+        This helper method walks through the repository directory structure
+        and yields paths to all files that should be included in the index.
+        
+        Returns:
+            Iterator of relative file paths
+        """
+        file_paths = self._get_all_files()
+        if self.cache_path is None:
+            return file_paths
+        
+        try:
+            cache_rel = Path(os.path.relpath(self.cache_path, self.repo_path)).as_posix()
+        except ValueError:
+            # On Windows, relpath fails when the cache is on another drive
+            return file_paths
+        if cache_rel == '..' or cache_rel.startswith('../'):
+            return file_paths
         
-        return all_files
+        # Never index the parse cache or its SQLite sidecars (-journal, -wal, -shm)
+        # if it lives inside the repository
+        sidecar_prefix = cache_rel + '-'
+        return (
+            path for path in file_paths
+            if path != cache_rel and not path.startswith(sidecar_prefix)
+        )
 
-    def _normalize_path(self, path: str) -> str:
+    def _get_all_files(self) -> Iterator[str]:
         """
-        Normalize a path by removing leading './' if present.
+        Get all non-ignored file paths in the repository.
         
-        Args:
-            path: Path to normalize
+        The walk uses an explicit stack of os.scandir calls, whose DirEntry
+        objects answer is_dir()/is_file() from cached directory data instead
+        of an extra stat per entry. Ignored directories are pruned before
+        they are descended into, and ignored files are filtered in the
+        same pass.
+        
+        Relative paths are built incrementally from the prefix of the
+        directory being scanned, so they always use '/' separators and never
+        start with './'.
         
         Returns:
-            Normalized path
+            Iterator of relative file paths
         """
-        if path.startswith('./'):
-            return path[2:]
-        return path
\ No newline at end of file
+        # Bind hot lookups to locals; should_ignore stays the single source of
+        # the ignore rules, so subclasses that override it also steer the walk
+        is_ignored = self.should_ignore
+        
+        # Each entry is (absolute directory path, relative prefix ending in '/')
+        stack = [(str(self.repo_path), '')]
+        push = stack.append
+        
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                # Unreadable directories are skipped, matching os.walk
+                continue
+            
+            with entries:
+                for entry in entries:
+                    path = prefix + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        dir_prefix = path + '/'
+                        if not is_ignored(dir_prefix):
+                            push((entry.path, dir_prefix))
+                    elif entry.is_file() and not is_ignored(path):
+                        yield path
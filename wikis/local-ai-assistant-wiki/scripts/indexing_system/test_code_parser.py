@@ -6,7 +6,6 @@ and processing code files from a repository.
 
 ## Test Structure
 
-- `test_normalize_path`: Tests the path normalization functionality
 - `test_get_all_files`: Tests file discovery across directories
 
 ## Running Tests
@@ -20,49 +19,26 @@ pytest test_code_parser.py -v
 For specific tests:
 
 ```bash
-pytest test_code_parser.py::test_normalize_path -v
+pytest test_code_parser.py::test_get_all_files -v
 ```
 """
 
-import pytest
+import errno
 import os
 from pathlib import Path
+import code_parser
 from code_parser import CodeParser
 
-def test_normalize_path():
-    """
-    Test the _normalize_path method which removes leading './' from paths.
-    
-    Cases tested:
-    - Path with leading './'
-    - Path without leading './'
-    - Empty path
-    - Just the './' pattern
-    """
-    parser = CodeParser("dummy/path")
-    
-    # Test path with leading './'
-    assert parser._normalize_path("./some/file.py") == "some/file.py"
-    
-    # Test path without leading './'
-    assert parser._normalize_path("some/file.py") == "some/file.py"
-    
-    # Test empty path
-    assert parser._normalize_path("") == ""
-    
-    # Test just the './' pattern
-    assert parser._normalize_path("./") == ""
-
-def test_get_all_files():
+def test_get_all_files(tmp_path):
     """
     Test the _get_all_files method which discovers all files in a directory structure.
     
     This test creates a temporary directory structure, runs the file discovery,
-    and verifies the correct files are found regardless of platform-specific path formats.
+    and verifies the correct files are found with '/'-separated relative paths.
     
     ASCII diagram of test directory structure:
     
-    test_repo/
+    repo/
     ├── file1.py
     ├── file2.js
     └── subdir/
@@ -70,52 +46,36 @@ def test_get_all_files():
         └── nested/
             └── file4.txt
     
-    The test verifies that all files are discovered and paths are properly normalized.
+    The test verifies that all files are discovered and paths are exact, with no
+    backslashes or leading './' on any platform.
     """
-    # Create a mock directory structure
-    with pytest.MonkeyPatch().context() as mp:
-        # Create a temporary test directory structure
-        test_dir = "test_repo"
-        os.makedirs(f"{test_dir}/subdir/nested", exist_ok=True)
-        
-        # Create some empty files
-        open(f"{test_dir}/file1.py", "w").close()
-        open(f"{test_dir}/file2.js", "w").close()
-        open(f"{test_dir}/subdir/file3.py", "w").close()
-        open(f"{test_dir}/subdir/nested/file4.txt", "w").close()
-        
-        try:
-            # Initialize parser with our test directory
-            parser = CodeParser(test_dir)
-            
-            # Call the method
-            result = parser._get_all_files()
-            
-            # Normalize the result paths for comparison
-            normalized_result = []
-            for path in result:
-                # Replace backslashes with forward slashes
-                path = path.replace('\\', '/')
-                # Remove leading './'
-                if path.startswith('./'):
-                    path = path[2:]
-                normalized_result.append(path)
-            
-            # Check the results
-            expected = [
-                'file1.py', 
-                'file2.js', 
-                'subdir/file3.py', 
-                'subdir/nested/file4.txt'
-            ]
-            
-            assert sorted(normalized_result) == sorted(expected)
-        finally:
-            # Clean up test directory
-            import shutil
-            shutil.rmtree(test_dir)
+    # Create a temporary test directory structure
+    test_dir = tmp_path / "repo"
+    os.makedirs(f"{test_dir}/subdir/nested", exist_ok=True)
+    
+    # Create some empty files
+    open(f"{test_dir}/file1.py", "w").close()
+    open(f"{test_dir}/file2.js", "w").close()
+    open(f"{test_dir}/subdir/file3.py", "w").close()
+    open(f"{test_dir}/subdir/nested/file4.txt", "w").close()
+    
+    # Initialize parser with our test directory
+    parser = CodeParser(test_dir)
+    
+    # Call the method
+    result = list(parser._get_all_files())
+    
+    # Paths must be '/'-separated and relative, with no leading './'
+    expected = [
+        'file1.py', 
+        'file2.js', 
+        'subdir/file3.py', 
+        'subdir/nested/file4.txt'
+    ]
+    
+    assert sorted(result) == sorted(expected)
 
-def test_get_relevant_file_paths():
+def test_get_relevant_file_paths(tmp_path):
     """
     Test the _get_relevant_file_paths method which filters files based on ignore patterns.
     
@@ -123,56 +83,64 @@ def test_get_relevant_file_paths():
     some of which should be ignored based on the default ignore patterns.
     It then verifies that only the relevant files are returned.
     """
-    # Create a mock directory structure
-    with pytest.MonkeyPatch().context() as mp:
-        # Create a temporary test directory structure
-        test_dir = "test_repo"
-        os.makedirs(f"{test_dir}/node_modules", exist_ok=True)
-        os.makedirs(f"{test_dir}/.git", exist_ok=True)
-        os.makedirs(f"{test_dir}/src", exist_ok=True)
-        
-        # Create some files that should be included
-        open(f"{test_dir}/src/main.py", "w").close()
-        open(f"{test_dir}/src/utils.js", "w").close()
-        open(f"{test_dir}/README.md", "w").close()
-        
-        # Create some files that should be ignored
-        open(f"{test_dir}/node_modules/package.json", "w").close()
-        open(f"{test_dir}/.git/HEAD", "w").close()
-        open(f"{test_dir}/image.png", "w").close()
-        open(f"{test_dir}/src/script.pyc", "w").close()
-        
-        try:
-            # Initialize parser with our test directory
-            parser = CodeParser(test_dir)
-            
-            # Call the method
-            result = parser._get_relevant_file_paths()
-            
-            # Normalize the result paths for comparison
-            normalized_result = []
-            for path in result:
-                # Replace backslashes with forward slashes for cross-platform compatibility
-                path = path.replace('\\', '/')
-                # Remove leading './' if present
-                if path.startswith('./'):
-                    path = path[2:]
-                normalized_result.append(path)
-            
-            # Check the results - only non-ignored files should be included
-            expected = [
-                'src/main.py',
-                'src/utils.js',
-                'README.md'
-            ]
-            
-            assert sorted(normalized_result) == sorted(expected)
-        finally:
-            # Clean up test directory
-            import shutil
-            shutil.rmtree(test_dir)
+    # Create a temporary test directory structure
+    test_dir = tmp_path / "repo"
+    os.makedirs(f"{test_dir}/node_modules", exist_ok=True)
+    os.makedirs(f"{test_dir}/.git", exist_ok=True)
+    os.makedirs(f"{test_dir}/src", exist_ok=True)
+    
+    # Create some files that should be included
+    open(f"{test_dir}/src/main.py", "w").close()
+    open(f"{test_dir}/src/utils.js", "w").close()
+    open(f"{test_dir}/README.md", "w").close()
+    
+    # Create some files that should be ignored
+    open(f"{test_dir}/node_modules/package.json", "w").close()
+    open(f"{test_dir}/.git/HEAD", "w").close()
+    open(f"{test_dir}/image.png", "w").close()
+    open(f"{test_dir}/src/script.pyc", "w").close()
+    
+    # Initialize parser with our test directory
+    parser = CodeParser(test_dir)
+    
+    # Call the method
+    result = list(parser._get_relevant_file_paths())
+    
+    # Check the results - only non-ignored files should be included
+    expected = [
+        'src/main.py',
+        'src/utils.js',
+        'README.md'
+    ]
+    
+    assert sorted(result) == sorted(expected)
 
-def test_parse_repository():
+def test_get_all_files_uses_should_ignore(tmp_path):
+    """
+    Test that the walk applies exactly the rules in should_ignore.
+    
+    A subclass overriding should_ignore must change which files and
+    directories the walk returns, so the two can never disagree.
+    """
+    test_dir = tmp_path / "repo"
+    os.makedirs(f"{test_dir}/src", exist_ok=True)
+    os.makedirs(f"{test_dir}/generated", exist_ok=True)
+    for name in ["src/main.py", "src/notes.tmp", "generated/api.py", "logo.png"]:
+        open(f"{test_dir}/{name}", "w").close()
+    
+    class CustomParser(CodeParser):
+        def should_ignore(self, file_path):
+            return (file_path.endswith(".tmp") or file_path == "generated/"
+                    or super().should_ignore(file_path))
+    
+    assert sorted(CustomParser(test_dir)._get_all_files()) == ['src/main.py']
+    
+    parser = CodeParser(test_dir)
+    walked = set(parser._get_all_files())
+    for name in ["src/main.py", "src/notes.tmp", "generated/api.py", "logo.png"]:
+        assert (name in walked) == (not parser.should_ignore(name))
+
+def test_parse_repository(tmp_path):
     """
     Test the parse_repository method which processes all relevant files in a repository.
     
@@ -180,116 +148,266 @@ def test_parse_repository():
     runs the repository parsing, and verifies that all relevant files are
     correctly parsed with appropriate metadata.
     """
-    # Create a mock directory structure
-    with pytest.MonkeyPatch().context() as mp:
-        # Create a temporary test directory structure
-        test_dir = "test_repo"
-        os.makedirs(f"{test_dir}/src", exist_ok=True)
-        
-        # Create some test files with content
-        with open(f"{test_dir}/src/main.py", "w") as f:
-            f.write("def main():\n    print('Hello world')")
-        with open(f"{test_dir}/src/utils.js", "w") as f:
-            f.write("function helper() { return true; }")
-        with open(f"{test_dir}/README.md", "w") as f:
-            f.write("# Test Repository")
-        
-        # Create a file that should be ignored
-        os.makedirs(f"{test_dir}/node_modules", exist_ok=True)
-        with open(f"{test_dir}/node_modules/ignored.js", "w") as f:
-            f.write("// This should be ignored")
-        
-        try:
-            # Initialize parser with our test directory
-            parser = CodeParser(test_dir)
-            
-            # Call the method
-            result = parser.parse_repository()
-            
-            # Check the results
-            assert len(result) == 3  # Should have 3 files (not the ignored one)
-            
-            # Normalize the paths for comparison
-            normalized_paths = []
-            for item in result:
-                path = item['path'].replace('\\', '/')
-                # Remove leading './' if present
-                if path.startswith('./'):
-                    path = path[2:]
-                normalized_paths.append(path)
-            
-            # Verify file paths are correct
-            expected_paths = ['src/main.py', 'src/utils.js', 'README.md']
-            assert sorted(normalized_paths) == sorted(expected_paths)
-            
-            # Verify languages are detected correctly
-            languages = {}
-            for item in result:
-                path = item['path'].replace('\\', '/')
-                if path.startswith('./'):
-                    path = path[2:]
-                languages[path] = item['language']
-                
-            assert languages['src/main.py'] == 'python'
-            assert languages['src/utils.js'] == 'javascript'
-            assert languages['README.md'] == 'markdown'
-            
-            # Verify content is parsed correctly
-            for item in result:
-                path = item['path'].replace('\\', '/')
-                if path.startswith('./'):
-                    path = path[2:]
-                    
-                if path == 'src/main.py':
-                    assert "def main():" in item['content']
-                elif path == 'src/utils.js':
-                    assert "function helper()" in item['content']
-        finally:
-            # Clean up test directory
-            import shutil
-            shutil.rmtree(test_dir)
+    # Create a temporary test directory structure
+    test_dir = tmp_path / "repo"
+    os.makedirs(f"{test_dir}/src", exist_ok=True)
+    
+    # Create some test files with content
+    with open(f"{test_dir}/src/main.py", "w") as f:
+        f.write("def main():\n    print('Hello world')")
+    with open(f"{test_dir}/src/utils.js", "w") as f:
+        f.write("function helper() { return true; }")
+    with open(f"{test_dir}/README.md", "w") as f:
+        f.write("# Test Repository")
+    
+    # Create a file that should be ignored
+    os.makedirs(f"{test_dir}/node_modules", exist_ok=True)
+    with open(f"{test_dir}/node_modules/ignored.js", "w") as f:
+        f.write("// This should be ignored")
+    
+    # Initialize parser with our test directory
+    parser = CodeParser(test_dir)
+    
+    # Call the method
+    result = list(parser.parse_repository())
+    
+    # Check the results
+    assert len(result) == 3  # Should have 3 files (not the ignored one)
+    
+    # Verify file paths are exactly the '/'-separated relative paths
+    expected_paths = ['src/main.py', 'src/utils.js', 'README.md']
+    assert sorted(item['path'] for item in result) == sorted(expected_paths)
+    
+    # Verify languages are detected correctly
+    languages = {item['path']: item['language'] for item in result}
+    assert languages['src/main.py'] == 'python'
+    assert languages['src/utils.js'] == 'javascript'
+    assert languages['README.md'] == 'markdown'
+    
+    # Verify content is parsed correctly
+    for item in result:
+        if item['path'] == 'src/main.py':
+            assert "def main():" in item['content']
+        elif item['path'] == 'src/utils.js':
+            assert "function helper()" in item['content']
 
-def test_parse_file():
+def test_parse_file(tmp_path):
     """
     Test the parse_file method which processes a single file and extracts its content and metadata.
     
     This test creates a temporary file with known content, parses it using the CodeParser,
     and verifies that the returned metadata (path, content, language, size) is correct.
     """
-    # Create a mock directory structure
-    with pytest.MonkeyPatch().context() as mp:
-        # Create a temporary test directory and file
-        test_dir = "test_repo"
-        os.makedirs(test_dir, exist_ok=True)
-        
-        # Create a test file with known content
-        test_file_path = "test_file.py"
-        test_content = "def test_function():\n    return True"
-        
-        with open(f"{test_dir}/{test_file_path}", "w") as f:
-            f.write(test_content)
+    # Create a temporary test directory and file
+    test_dir = tmp_path / "repo"
+    os.makedirs(test_dir, exist_ok=True)
+    
+    # Create a test file with known content
+    test_file_path = "test_file.py"
+    test_content = "def test_function():\n    return True"
+    
+    with open(f"{test_dir}/{test_file_path}", "w") as f:
+        f.write(test_content)
+    
+    # Initialize parser with our test directory
+    parser = CodeParser(test_dir)
+    
+    # Call the method
+    result = parser.parse_file(test_file_path)
+    
+    # Verify the result
+    assert result is not None
+    assert result['path'] == test_file_path
+    assert result['content'] == test_content
+    assert result['language'] == 'python'
+    assert result['size'] == len(test_content)
+    
+    # Test with a non-existent file
+    non_existent = parser.parse_file("non_existent.py")
+    assert non_existent is None
+
+def test_parse_repository_unordered(tmp_path):
+    """
+    Test that parse_repository(ordered=False) yields the same files as the ordered walk.
+    
+    Unordered mode yields files as soon as their reads complete, so only the
+    set of parsed paths is compared.
+    """
+    test_dir = tmp_path / "repo"
+    os.makedirs(f"{test_dir}/src", exist_ok=True)
+    
+    for name in ["a.py", "b.py", "c.js"]:
+        with open(f"{test_dir}/src/{name}", "w") as f:
+            f.write(f"// {name}")
+    
+    parser = CodeParser(test_dir, max_workers=2)
+    
+    ordered = [item['path'] for item in parser.parse_repository()]
+    unordered = [item['path'] for item in parser.parse_repository(ordered=False)]
+    
+    assert len(unordered) == 3
+    assert sorted(unordered) == sorted(ordered)
+
+def test_parse_repository_cache(tmp_path):
+    """
+    Test that parse_repository reuses cached results for unchanged files.
+    
+    The first run writes the cache. On the second run parse_file must only be
+    called for the file whose contents changed, and the cache file itself
+    (stored inside the repository here) must never be indexed.
+    """
+    test_dir = tmp_path / "repo"
+    os.makedirs(f"{test_dir}/src", exist_ok=True)
+    
+    with open(f"{test_dir}/src/main.py", "w") as f:
+        f.write("def main():\n    pass")
+    with open(f"{test_dir}/src/utils.js", "w") as f:
+        f.write("function helper() {}")
+    
+    cache_path = f"{test_dir}/.codeparser_cache.sqlite"
+    first = list(CodeParser(test_dir, cache_path=cache_path).parse_repository())
+    assert sorted(item['path'] for item in first) == ['src/main.py', 'src/utils.js']
+    assert os.path.exists(cache_path)
+    
+    # Change one file's size so its (mtime, size) key no longer matches
+    with open(f"{test_dir}/src/utils.js", "w") as f:
+        f.write("function helper() { return 1; }")
+    
+    parser = CodeParser(test_dir, cache_path=cache_path)
+    parsed = []
+    original_parse_file = parser.parse_file
+    def tracking_parse_file(file_path):
+        parsed.append(file_path)
+        return original_parse_file(file_path)
+    parser.parse_file = tracking_parse_file
+    
+    second = {item['path']: item for item in parser.parse_repository()}
+    assert parsed == ['src/utils.js']
+    assert sorted(second) == ['src/main.py', 'src/utils.js']
+    assert "return 1" in second['src/utils.js']['content']
+    assert "def main()" in second['src/main.py']['content']
+
+def test_parse_repository_cache_named_like_source(tmp_path):
+    """
+    Test that only the cache file and its SQLite sidecars are excluded from the walk.
+    
+    A cache named 'index' inside the repository must not hide source files
+    that merely share its name as a prefix, such as index.js.
+    """
+    test_dir = tmp_path / "repo"
+    os.makedirs(test_dir, exist_ok=True)
+    for name in ["index.js", "index_test.py", "main.py"]:
+        with open(f"{test_dir}/{name}", "w") as f:
+            f.write("// source")
+    with open(f"{test_dir}/index-journal", "w") as f:
+        f.write("sidecar")
+    
+    cache_path = f"{test_dir}/index"
+    parser = CodeParser(test_dir, include_unknown=True, cache_path=cache_path)
+    result = list(parser.parse_repository())
+    
+    assert sorted(item['path'] for item in result) == ['index.js', 'index_test.py', 'main.py']
+
+def test_parse_repository_cache_unavailable(tmp_path, caplog):
+    """
+    Test that an unusable cache is logged and never interrupts parsing.
+    
+    Covers a cache path whose directory does not exist and a cache file that
+    is not an SQLite database.
+    """
+    test_dir = tmp_path / "repo"
+    os.makedirs(test_dir, exist_ok=True)
+    with open(f"{test_dir}/main.py", "w") as f:
+        f.write("print('hi')")
+    
+    missing_dir = f"{tmp_path}/missing/cache.sqlite"
+    result = list(CodeParser(test_dir, cache_path=missing_dir).parse_repository())
+    assert [item['path'] for item in result] == ['main.py']
+    
+    corrupt = f"{tmp_path}/corrupt.sqlite"
+    with open(corrupt, "w") as f:
+        f.write("not a database")
+    result = list(CodeParser(test_dir, cache_path=corrupt).parse_repository())
+    assert [item['path'] for item in result] == ['main.py']
+    
+    assert "Parse cache" in caplog.text
+
+def test_parse_file_large_file(tmp_path):
+    """
+    Test that files above the memory-map threshold are decoded correctly.
+    
+    Large files are decoded straight from an mmap; the content and byte size
+    must match what a normal read would produce, including multi-byte UTF-8.
+    """
+    test_dir = tmp_path / "repo"
+    os.makedirs(test_dir, exist_ok=True)
+    
+    test_content = "caf\u00e9 = 'latte'\n" * 10000
+    with open(f"{test_dir}/large.py", "w", encoding="utf-8") as f:
+        f.write(test_content)
+    
+    parser = CodeParser(test_dir)
+    result = parser.parse_file("large.py")
+    
+    assert result is not None
+    assert result['content'] == test_content
+    assert result['size'] == len(test_content.encode("utf-8"))
+
+def test_parse_file_mmap_failure_falls_back(tmp_path, monkeypatch):
+    """
+    Test that a file which cannot be memory-mapped is read normally instead.
+    
+    mmap raises ValueError for a file truncated to zero bytes between fstat
+    and the map, and OSError (e.g. ENODEV) on filesystems that cannot be
+    mapped; parse_file must fall back to read() rather than skip the file.
+    """
+    test_dir = tmp_path / "repo"
+    os.makedirs(test_dir, exist_ok=True)
+    
+    test_content = "x = 1\n" * 20000
+    with open(f"{test_dir}/large.py", "w") as f:
+        f.write(test_content)
+    
+    for error in [ValueError("cannot mmap an empty file"),
+                  OSError(errno.ENODEV, "No such device")]:
+        def failing_mmap(*args, error=error, **kwargs):
+            raise error
+        monkeypatch.setattr(code_parser.mmap, "mmap", failing_mmap)
         
-        try:
-            # Initialize parser with our test directory
-            parser = CodeParser(test_dir)
-            
-            # Call the method
-            result = parser.parse_file(test_file_path)
-            
-            # Verify the result
-            assert result is not None
-            assert result['path'] == test_file_path
-            assert result['content'] == test_content
-            assert result['language'] == 'python'
-            assert result['size'] == len(test_content)
-            
-            # Test with a non-existent file
-            non_existent = parser.parse_file("non_existent.py")
-            assert non_existent is None
-        finally:
-            # Clean up test directory
-            import shutil
-            shutil.rmtree(test_dir)
+        result = CodeParser(test_dir).parse_file("large.py")
+        assert result is not None
+        assert result['content'] == test_content
+
+def test_parse_file_skips_unknown_and_large_files(tmp_path):
+    """
+    Test that parse_file skips files it should not read.
+    
+    This test verifies that:
+    1. Files with an unknown extension are skipped unless include_unknown is set
+    2. Files larger than max_bytes are skipped
+    """
+    test_dir = tmp_path / "repo"
+    os.makedirs(test_dir, exist_ok=True)
+    
+    with open(f"{test_dir}/notes.txt", "w") as f:
+        f.write("plain text")
+    with open(f"{test_dir}/big.py", "w") as f:
+        f.write("x = 1\n" * 100)
+    
+    parser = CodeParser(test_dir, max_bytes=64)
+    
+    # Unknown extension is skipped by default
+    assert parser.parse_file("notes.txt") is None
+    
+    # File over the size limit is skipped
+    assert parser.parse_file("big.py") is None
+    
+    # Both are parsed when the limits are relaxed
+    permissive = CodeParser(test_dir, include_unknown=True, max_bytes=None)
+    notes = permissive.parse_file("notes.txt")
+    assert notes is not None
+    assert notes['language'] is None
+    assert permissive.parse_file("big.py") is not None
 
 def test_get_file_language():
     """
@@ -315,6 +433,11 @@ def test_get_file_language():
     # Test unknown extension
     assert parser.get_file_language("data.unknown") is None
     assert parser.get_file_language("no_extension") is None
+    
+    # Dotfiles have no extension, as with os.path.splitext
+    assert parser.get_file_language(".py") is None
+    assert parser.get_file_language("config/.json") is None
+    assert parser.get_file_language("config/.eslintrc.json") == "json"
 
 def test_should_ignore():
     """
@@ -333,6 +456,16 @@ def test_should_ignore():
     assert parser.should_ignore("__pycache__/module.pyc") == True
     assert parser.should_ignore("image.png") == True
     
+    # Leading '*' lets directory patterns match at any depth
+    assert parser.should_ignore(".git/HEAD") == True
+    assert parser.should_ignore("vendor/.git/HEAD") == True
+    assert parser.should_ignore("web/node_modules/lib/index.js") == True
+    
+    # Directory paths (with a trailing '/') match so the walk can prune them
+    assert parser.should_ignore(".git/") == True
+    assert parser.should_ignore("web/node_modules/") == True
+    assert parser.should_ignore("src/") == False
+    
     # Test files that should not be ignored
     assert parser.should_ignore("src/main.py") == False
     assert parser.should_ignore("README.md") == False
@@ -343,6 +476,15 @@ def test_should_ignore():
     assert custom_parser.should_ignore("app.log") == True
     assert custom_parser.should_ignore("temp/cache.txt") == True
     assert custom_parser.should_ignore("src/app.py") == False
+    
+    # Bare extension patterns match case-insensitively and need a '.'
+    assert parser.should_ignore("assets/LOGO.PNG") == True
+    assert parser.should_ignore("png") == False
+    
+    # Only extension patterns: the residual regex must not match everything
+    ext_only_parser = CodeParser("dummy/path", ignore_patterns=["*.log"])
+    assert ext_only_parser.should_ignore("debug.log") == True
+    assert ext_only_parser.should_ignore("src/app.py") == False
 
 def test_init_default_ignore_patterns():
     """
@@ -382,127 +524,3 @@ def test_init_custom_ignore_patterns():
     # Check custom patterns are used instead of defaults
     assert parser.ignore_patterns == custom_patterns
     assert "*.git/*" not in parser.ignore_patterns
-
-def test_parse_repository():
-    """
-    Test the parse_repository method which processes all relevant files in a repository.
-    
-    This test creates a temporary directory structure with various files,
-    runs the repository parsing, and verifies that all relevant files are
-    correctly parsed with appropriate metadata.
-    """
-    # Create a mock directory structure
-    with pytest.MonkeyPatch().context() as mp:
-        # Create a temporary test directory structure
-        test_dir = "test_repo"
-        os.makedirs(f"{test_dir}/src", exist_ok=True)
-        
-        # Create some test files with content
-        with open(f"{test_dir}/src/main.py", "w") as f:
-            f.write("def main():\n    print('Hello world')")
-        with open(f"{test_dir}/src/utils.js", "w") as f:
-            f.write("function helper() { return true; }")
-        with open(f"{test_dir}/README.md", "w") as f:
-            f.write("# Test Repository")
-        
-        # Create a file that should be ignored
-        os.makedirs(f"{test_dir}/node_modules", exist_ok=True)
-        with open(f"{test_dir}/node_modules/ignored.js", "w") as f:
-            f.write("// This should be ignored")
-        
-        try:
-            # Initialize parser with our test directory
-            parser = CodeParser(test_dir)
-            
-            # Call the method
-            result = parser.parse_repository()
-            
-            # Check the results
-            assert len(result) == 3  # Should have 3 files (not the ignored one)
-            
-            # Normalize the paths for comparison
-            normalized_paths = []
-            for item in result:
-                path = item['path'].replace('\\', '/')
-                # Remove leading './' if present
-                if path.startswith('./'):
-                    path = path[2:]
-                normalized_paths.append(path)
-            
-            # Verify file paths are correct
-            expected_paths = ['src/main.py', 'src/utils.js', 'README.md']
-            assert sorted(normalized_paths) == sorted(expected_paths)
-            
-            # Verify languages are detected correctly
-            languages = {}
-            for item in result:
-                path = item['path'].replace('\\', '/')
-                if path.startswith('./'):
-                    path = path[2:]
-                languages[path] = item['language']
-                
-            assert languages['src/main.py'] == 'python'
-            assert languages['src/utils.js'] == 'javascript'
-            assert languages['README.md'] == 'markdown'
-            
-            # Verify content is parsed correctly
-            for item in result:
-                path = item['path'].replace('\\', '/')
-                if path.startswith('./'):
-                    path = path[2:]
-                    
-                if path == 'src/main.py':
-                    assert "def main():" in item['content']
-                elif path == 'src/utils.js':
-                    assert "function helper()" in item['content']
-        finally:
-            # Clean up test directory
-            import shutil
-            shutil.rmtree(test_dir)
-
-def test_parse_file():
-    """
-    Test the parse_file method which processes a single file and extracts its content and metadata.
-    
-    This test creates a temporary file with known content, parses it using the CodeParser,
-    and verifies that the returned metadata (path, content, language, size) is correct.
-    """
-    # Create a mock directory structure
-    with pytest.MonkeyPatch().context() as mp:
-        # Create a temporary test directory and file
-        test_dir = "test_repo"
-        os.makedirs(test_dir, exist_ok=True)
-        
-        # Create a test file with known content
-        test_file_path = "test_file.py"
-        test_content = "def test_function():\n    return True"
-        
-        with open(f"{test_dir}/{test_file_path}", "w") as f:
-            f.write(test_content)
-        
-        try:
-            # Initialize parser with our test directory
-            parser = CodeParser(test_dir)
-            
-            # Call the method
-            result = parser.parse_file(test_file_path)
-            
-            # Verify the result
-            assert result is not None
-            assert result['path'] == test_file_path
-            assert result['content'] == test_content
-            assert result['language'] == 'python'
-            assert result['size'] == len(test_content)
-            
-            # Test with a non-existent file
-            non_existent = parser.parse_file("non_existent.py")
-            assert non_existent is None
-        finally:
-            # Clean up test directory
-            import shutil
-            shutil.rmtree(test_dir)
-
-
-
-
-
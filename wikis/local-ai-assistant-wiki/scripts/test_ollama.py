@@ -1,5 +1,17 @@
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+# orjson parses large responses several times faster; fall back to the stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Reuse one pooled connection to the local Ollama server across calls
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 def query_ollama(prompt, model="code-assistant"):
     """Send a prompt to Ollama and get the response."""
@@ -10,8 +22,8 @@ def query_ollama(prompt, model="code-assistant"):
         "stream": False
     }
 
-    response = requests.post(url, json=data)
-    return response.json()["response"]
+    response = _SESSION.post(url, json=data)
+    return _json_loads(response.content)["response"]
 
 # Test with a simple coding prompt
 prompt = "Write a Python function to check if a number is prime."
@@ -2,6 +2,18 @@
 import requests
 import time
 import json
+from requests.adapters import HTTPAdapter
+
+# orjson parses each chunk several times faster; fall back to the stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Reuse one pooled connection when the test is run in a loop
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 def test_ollama_performance():
     url = "http://127.0.0.1:11434/api/generate"
@@ -12,30 +24,53 @@ def test_ollama_performance():
     payload = {
         "model": "codellama:13b",
         "prompt": prompt,
-        "stream": False
+        "stream": True
     }
     
     print("Testing Ollama performance...")
-    start_time = time.time()
+    start_time = time.perf_counter()
+    first_token_time = None
+    response_length = 0
+    result = None
     
     try:
-        response = requests.post(url, json=payload, timeout=60)
-        end_time = time.time()
-        
-        if response.status_code == 200:
-            result = response.json()
-            duration = end_time - start_time
-            response_length = len(result.get('response', ''))
-            tokens_per_second = response_length / duration if duration > 0 else 0
+        with _SESSION.post(url, json=payload, timeout=60, stream=True) as response:
+            if response.status_code != 200:
+                print(f"❌ Error: {response.status_code}")
+                print(response.text)
+                return
             
-            print(f"✅ Success!")
-            print(f"⏱️  Duration: {duration:.2f} seconds")
-            print(f"📝 Response length: {response_length} characters")
-            print(f"🚀 Speed: ~{tokens_per_second:.1f} chars/second")
-            print(f"📊 Model: {result.get('model', 'unknown')}")
-        else:
-            print(f"❌ Error: {response.status_code}")
-            print(response.text)
+            # Each line is one JSON chunk; the last one has "done": true and the stats
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = _json_loads(line)
+                if chunk.get('error'):
+                    print(f"❌ Error: {chunk['error']}")
+                    return
+                if first_token_time is None and chunk.get('response'):
+                    first_token_time = time.perf_counter()
+                response_length += len(chunk.get('response', ''))
+                if chunk.get('done'):
+                    result = chunk
+                    break
+        
+        if result is None:
+            print("❌ Error: stream ended before Ollama reported completion")
+            return
+        
+        duration = time.perf_counter() - start_time
+        ttft = (first_token_time or time.perf_counter()) - start_time
+        tokens = result.get('eval_count', 0)
+        eval_duration = result.get('eval_duration', 0)
+        tokens_per_second = tokens / eval_duration * 1e9 if eval_duration > 0 else 0
+        
+        print(f"✅ Success!")
+        print(f"⏱️  Duration: {duration:.2f} seconds")
+        print(f"⚡ Time to first token: {ttft:.2f} seconds")
+        print(f"📝 Response length: {tokens} tokens ({response_length} characters)")
+        print(f"🚀 Speed: {tokens_per_second:.1f} tokens/second")
+        print(f"📊 Model: {result.get('model', 'unknown')}")
     
     except requests.exceptions.RequestException as e:
         print(f"❌ Connection error: {e}")